@@ -31,13 +31,16 @@ async def a_main(
         token_stream_callback=None,
         agent_urls=[f'http://{host}:{port}/'],
     )
-    async for chunk in agent.stream(question):
-        if chunk.startswith('<Agent name="'):
-            print(colorama.Fore.CYAN + chunk, end='', flush=True)
-        elif chunk.startswith('</Agent>'):
-            print(colorama.Fore.RESET + chunk, end='', flush=True)
-        else:
-            print(chunk, end='', flush=True)
+    try:
+        async for chunk in agent.stream(question):
+            if chunk.startswith('<Agent name="'):
+                print(colorama.Fore.CYAN + chunk, end='', flush=True)
+            elif chunk.startswith('</Agent>'):
+                print(colorama.Fore.RESET + chunk, end='', flush=True)
+            else:
+                print(chunk, end='', flush=True)
+    finally:
+        await agent.aclose()
 
 
 def main() -> None:
@@ -1,10 +1,11 @@
 import asyncio
-import json
-import re
+import itertools
+import time
 
-from collections.abc import Callable, Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import aclosing
 from pathlib import Path
-from typing import Literal
+from typing import Literal, TypeVar
 from uuid import uuid4
 
 import google.generativeai as genai
@@ -22,43 +23,251 @@ from a2a.types import (
     TaskStatusUpdateEvent,
     TextPart,
 )
-from jinja2 import Template
+from google.generativeai.types import GenerateContentResponse
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 
+# orjson is optional; it decodes the selected agents faster when installed.
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 dir_path = Path(__file__).parent
 
-with Path(dir_path / 'decide.jinja').open('r') as f:
-    decide_template = Template(f.read())
+# Templates are compiled once per process and their bytecode is cached on
+# disk, so later processes skip parsing the Jinja source entirely.
+_env = Environment(
+    loader=FileSystemLoader(str(dir_path)),
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+decide_template = _env.get_template('decide.jinja')
+agents_template = _env.get_template('agents.jinja')
+agent_answer_template = _env.get_template('agent_answer.jinja')
+
+# Agent cards rarely change, so they are refetched at most once per TTL.
+_AGENT_CARDS_TTL = 60.0
 
-with Path(dir_path / 'agents.jinja').open('r') as f:
-    agents_template = Template(f.read())
+# Connection pool of the shared HTTP client. Idle agent connections are kept
+# for 30s so consecutive decide rounds and concurrent agent streams reuse
+# them instead of reconnecting.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=32, keepalive_expiry=30
+)
+
+# Upper bound on the first-round decide prompts memoized per Agent.
+_FIRST_PROMPTS_MAXSIZE = 32
 
-with Path(dir_path / 'agent_answer.jinja').open('r') as f:
-    agent_answer_template = Template(f.read())
+# Upper bound on the rendered agent prompts shared by all Agents.
+_AGENT_PROMPTS_MAXSIZE = 32
 
+_JSON_OPEN, _JSON_CLOSE = '```json\n', '\n```'
+_ANSWER_OPEN, _ANSWER_CLOSE = '<Answer>', '</Answer>'
+
+# Built once so every prompt shares the same SDK client; None when the
+# installed google.generativeai predates GenerativeModel.
+_GEMINI_MODEL = (
+    genai.GenerativeModel('gemini-1.5-flash')
+    if hasattr(genai, 'GenerativeModel')
+    else None
+)
 
-def stream_llm(prompt: str) -> Generator[str]:
+
+def stream_llm(prompt: str) -> GenerateContentResponse:
     """Stream LLM response.
 
+    The SDK response is returned as is rather than re-yielded chunk by chunk,
+    which saves a generator frame switch per token; read `.text` from each
+    chunk it yields.
+
     Args:
         prompt (str): The prompt to send to the LLM.
 
     Returns:
-        Generator[str, None, None]: A generator of the LLM response.
+        GenerateContentResponse: An iterable of the LLM response chunks.
     """
-    # Remove configure call for compatibility with google.generativeai >= 0.5.0
-    model = getattr(genai, 'GenerativeModel', None)
-    if model is not None:
-        model = model('gemini-1.5-flash')
-        for chunk in model.generate_content(prompt, stream=True):
-            yield chunk.text
-    else:
+    if _GEMINI_MODEL is None:
         raise ImportError('google.generativeai does not have GenerativeModel. Please update the package.')
+    return _GEMINI_MODEL.generate_content(prompt, stream=True)
+
+
+def _find_between(text: str, start: str, end: str) -> str | None:
+    """Return the text between the first `start` and the next `end`.
+
+    A plain scan is enough for these fixed, non-nesting delimiters and is
+    cheaper than a regex over the whole response.
+
+    Args:
+        text (str): The text to search.
+        start (str): The opening delimiter.
+        end (str): The closing delimiter.
+
+    Returns:
+        str | None: The enclosed text, or None if either delimiter is missing.
+    """
+    begin = text.find(start)
+    if begin < 0:
+        return None
+    begin += len(start)
+    stop = text.find(end, begin)
+    if stop < 0:
+        return None
+    return text[begin:stop]
+
+
+class _LLMStream:
+    """A streamed LLM response that can be stopped before it ends.
+
+    The SDK reads each chunk with a blocking network call, so chunks are
+    pulled in a worker thread and the event loop keeps serving other tasks,
+    such as concurrent agent calls, while the LLM streams. `close` cancels
+    the underlying request so the model stops generating instead of running
+    to the end of its answer.
+    """
+
+    def __init__(self, response: GenerateContentResponse):
+        self._response = response
+        self._chunks = iter(response)
+
+    def __aiter__(self) -> AsyncIterator[GenerateContentResponse]:
+        return self
+
+    async def __anext__(self) -> GenerateContentResponse:
+        chunk = await asyncio.to_thread(next, self._chunks, None)
+        if chunk is None:
+            raise StopAsyncIteration
+        return chunk
+
+    def close(self) -> None:
+        """Cancel the underlying request of the response."""
+        # The SDK has no public way to cancel a stream, but the iterators of
+        # both its gRPC and REST transports provide `cancel`.
+        cancel = getattr(
+            getattr(self._response, '_iterator', None), 'cancel', None
+        )
+        if cancel is not None:
+            cancel()
+
+
+class _FencedJsonScanner:
+    """Decode the first ```json fenced block of a streamed response.
+
+    Chunks are scanned as they arrive. Only the block body and a short tail,
+    needed to spot a fence split across chunks, are kept in memory.
+    """
+
+    def __init__(self):
+        self._tail = ''
+        self._block: list[str] | None = None
+        self._done = False
+
+    def feed(self, chunk: str) -> list[dict] | None:
+        """Scan the next chunk of the response.
+
+        Args:
+            chunk (str): The next chunk of the response.
+
+        Returns:
+            list[dict] | None: The decoded block once its closing fence has
+                been seen, otherwise None. Later calls always return None.
+        """
+        if self._done:
+            return None
+        text = self._tail + chunk
+        if self._block is None:
+            start = text.find(_JSON_OPEN)
+            if start < 0:
+                self._tail = text[max(len(text) - len(_JSON_OPEN) + 1, 0) :]
+                return None
+            self._block = []
+            text = text[start + len(_JSON_OPEN) :]
+        end = text.find(_JSON_CLOSE)
+        if end < 0:
+            split = max(len(text) - len(_JSON_CLOSE) + 1, 0)
+            self._block.append(text[:split])
+            self._tail = text[split:]
+            return None
+        self._block.append(text[:end])
+        self._done = True
+        return _json.loads(''.join(self._block))
+
+
+_T = TypeVar('_T')
+
+# Marks the end of a stream pumped into a queue by `_pump`.
+_DONE = object()
+
+
+async def _pump(stream: AsyncGenerator[_T], queue: asyncio.Queue) -> None:
+    """Copy every item of an async stream into a queue.
+
+    The stream is closed when the pump ends or is cancelled, so an open
+    streaming response is released right away rather than on GC.
+
+    Args:
+        stream (AsyncGenerator[_T]): The stream to consume.
+        queue (asyncio.Queue): The queue to fill. It receives `_DONE` once the
+            stream is exhausted, or the exception the stream raised.
+    """
+    try:
+        async with aclosing(stream):
+            async for item in stream:
+                await queue.put(item)
+    except Exception as e:
+        await queue.put(e)
+    else:
+        await queue.put(_DONE)
+
+
+async def _drain(queue: asyncio.Queue) -> AsyncIterator[_T]:
+    """Yield the items pumped into a queue by `_pump`.
+
+    Args:
+        queue (asyncio.Queue): The queue filled by `_pump`.
+
+    Yields:
+        _T: The items of the original stream, in order.
+    """
+    while (item := await queue.get()) is not _DONE:
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+async def _buffered(
+    stream: AsyncGenerator[_T], size: int = 16
+) -> AsyncIterator[_T]:
+    """Read ahead from an async stream while the caller handles each item.
+
+    A background task keeps up to `size` items queued, so the next network
+    read overlaps with the processing of the current item.
+
+    Args:
+        stream (AsyncGenerator[_T]): The stream to read ahead from.
+        size (int): The maximum number of items buffered ahead of the caller.
+
+    Yields:
+        _T: The items of the original stream, in order.
+    """
+    queue: asyncio.Queue = asyncio.Queue(size)
+    pump = asyncio.create_task(_pump(stream, queue))
+    try:
+        async for item in _drain(queue):
+            yield item
+    finally:
+        pump.cancel()
+        await asyncio.gather(pump, return_exceptions=True)
 
 
 class Agent:
     """Agent for interacting with the Google Gemini LLM in different modes."""
 
+    # Rendered agent prompts shared by all instances, keyed by the serialized
+    # cards so identical card sets render once.
+    _agent_prompts: dict[tuple[str, ...], str] = {}
+
     def __init__(
         self,
         mode: Literal['complete', 'stream'] = 'stream',
@@ -70,49 +279,144 @@ class Agent:
         self.token_stream_callback = token_stream_callback
         self.agent_urls = agent_urls
         self.agents_registry: dict[str, AgentCard] = {}
+        self._agent_prompt: str = ''
+        self._agents_fetched_at: float = 0.0
+        self._decide_prefix_key: tuple[str, str] | None = None
+        self._decide_prefix: str = ''
+        self._first_prompts: dict[tuple[str, str], str] = {}
+        self._httpx: httpx.AsyncClient | None = None
+        # JSON-RPC request ids only need to be unique per client, so a counter
+        # replaces a uuid4 (and its os.urandom call) per agent call.
+        self._request_ids = itertools.count(1)
+
+    async def _client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: A pooled client reused for every agent call.
+        """
+        if self._httpx is None:
+            self._httpx = httpx.AsyncClient(limits=_HTTP_LIMITS)
+        return self._httpx
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        if self._httpx is not None:
+            await self._httpx.aclose()
+            self._httpx = None
 
     async def get_agents(self) -> tuple[dict[str, AgentCard], str]:
         """Retrieve agent cards from all agent URLs and render the agent prompt.
 
+        The result is cached for `_AGENT_CARDS_TTL` seconds. The rendered
+        prompt is reused when a refetch returns identical cards.
+
         Returns:
             tuple[dict[str, AgentCard], str]: A dictionary mapping agent names to AgentCard objects, and the rendered agent prompt string.
         """  # noqa: E501
         if not self.agent_urls:
             return {}, ''
-        async with httpx.AsyncClient() as httpx_client:
-            card_resolvers = [A2ACardResolver(httpx_client, url) for url in self.agent_urls]
-            agent_cards = await asyncio.gather(*[card_resolver.get_agent_card() for card_resolver in card_resolvers])
-            agents_registry = {agent_card.name: agent_card for agent_card in agent_cards}
-            agent_prompt = agents_template.render(agent_cards=agent_cards)
-            return agents_registry, agent_prompt
-
-    def call_llm(self, prompt: str) -> Generator[str, None, None]:
-        """Call the LLM with the given prompt and return the response as a generator."""
+        if (
+            self.agents_registry
+            and time.monotonic() - self._agents_fetched_at < _AGENT_CARDS_TTL
+        ):
+            return self.agents_registry, self._agent_prompt
+        httpx_client = await self._client()
+        card_resolvers = [A2ACardResolver(httpx_client, url) for url in self.agent_urls]
+        agent_cards = await asyncio.gather(*[card_resolver.get_agent_card() for card_resolver in card_resolvers])
+        self._agents_fetched_at = time.monotonic()
+        self.agents_registry = {
+            agent_card.name: agent_card for agent_card in agent_cards
+        }
+        key = tuple(agent_card.model_dump_json() for agent_card in agent_cards)
+        if key not in self._agent_prompts:
+            if len(self._agent_prompts) >= _AGENT_PROMPTS_MAXSIZE:
+                del self._agent_prompts[next(iter(self._agent_prompts))]
+            self._agent_prompts[key] = agents_template.render(
+                agent_cards=agent_cards
+            )
+        self._agent_prompt = self._agent_prompts[key]
+        return self.agents_registry, self._agent_prompt
+
+    def call_llm(self, prompt: str) -> GenerateContentResponse:
+        """Call the LLM with the given prompt and stream its response.
+
+        Returns:
+            GenerateContentResponse: The LLM's response as an iterable of
+                chunks.
+        """
         return stream_llm(prompt)
 
+    def _decide_prompt(
+        self,
+        question: str,
+        agents_prompt: str,
+        called_agents: list[dict] | None = None,
+    ) -> str:
+        """Build the prompt that asks the LLM which agent(s) to use.
+
+        The prompt is split into a prefix that only depends on the question and
+        the agents, and a suffix with the previously called agents. The prefix
+        is rendered once and reused verbatim, so the repeated decide rounds of
+        a question share a byte-identical prompt prefix the LLM can cache.
+        First-round prompts, which have no called agents, are memoized whole.
+
+        Args:
+            question (str): The question to answer.
+            agents_prompt (str): The prompt describing available agents.
+            called_agents (list[dict] | None): Previously called agents and
+                their answers.
+
+        Returns:
+            str: The decide prompt.
+        """
+        key = (question, agents_prompt)
+        if not called_agents and key in self._first_prompts:
+            return self._first_prompts[key]
+        if self._decide_prefix_key != key:
+            self._decide_prefix = decide_template.module.prefix(
+                question=question, agent_prompt=agents_prompt
+            )
+            self._decide_prefix_key = key
+        if called_agents:
+            call_agent_prompt = agent_answer_template.render(
+                called_agents=called_agents
+            )
+            suffix = decide_template.module.suffix(
+                call_agent_prompt=call_agent_prompt
+            )
+            return self._decide_prefix + suffix
+        if len(self._first_prompts) >= _FIRST_PROMPTS_MAXSIZE:
+            del self._first_prompts[next(iter(self._first_prompts))]
+        prompt = self._first_prompts[key] = (
+            self._decide_prefix
+            + decide_template.module.suffix(call_agent_prompt='')
+        )
+        return prompt
+
     async def decide(
         self,
         question: str,
         agents_prompt: str,
         called_agents: list[dict] | None = None,
-    ) -> Generator[str, None]:
+    ) -> GenerateContentResponse:
         """Decide which agent(s) to use to answer the question.
 
+        The SDK call blocks until the first chunk arrives, so it runs in a
+        worker thread to keep the event loop free.
+
         Args:
             question (str): The question to answer.
             agents_prompt (str): The prompt describing available agents.
-            called_agents (list[dict] | None): Previously called agents and their answers.
+            called_agents (list[dict] | None): Previously called agents and
+                their answers.
 
         Returns:
-            Generator[str, None]: The LLM's response as a generator of strings.
+            GenerateContentResponse: The LLM's response as an iterable of
+                chunks.
         """
-        call_agent_prompt = agent_answer_template.render(called_agents=called_agents) if called_agents else ''
-        prompt = decide_template.render(
-            question=question,
-            agent_prompt=agents_prompt,
-            call_agent_prompt=call_agent_prompt,
-        )
-        return self.call_llm(prompt)
+        prompt = self._decide_prompt(question, agents_prompt, called_agents)
+        return await asyncio.to_thread(self.call_llm, prompt)
 
     def extract_agents(self, response: str) -> list[dict]:
         """Extract the agents from the response.
@@ -120,10 +424,9 @@ class Agent:
         Args:
             response (str): The response from the LLM.
         """
-        pattern = r'```json\n(.*?)\n```'
-        match = re.search(pattern, response, re.DOTALL)
-        if match:
-            return json.loads(match.group(1))
+        block = _find_between(response, _JSON_OPEN, _JSON_CLOSE)
+        if block is not None:
+            return _json.loads(block)
         return []
 
     async def send_message_to_an_agent(self, agent_card: AgentCard, message: str):
@@ -136,27 +439,135 @@ class Agent:
         Yields:
             str: The streaming response from the agent.
         """
-        async with httpx.AsyncClient() as httpx_client:
-            client = A2AClient(httpx_client, agent_card=agent_card)
-            message_params = MessageSendParams(
-                message=Message(
-                    role=Role.user,
-                    parts=[Part(TextPart(text=message))],
-                    messageId=uuid4().hex,
-                    taskId=uuid4().hex,
+        httpx_client = await self._client()
+        client = A2AClient(httpx_client, agent_card=agent_card)
+        message_params = MessageSendParams(
+            message=Message(
+                role=Role.user,
+                parts=[Part(TextPart(text=message))],
+                messageId=uuid4().hex,
+                taskId=uuid4().hex,
+            )
+        )
+        streaming_request = SendStreamingMessageRequest(
+            id=next(self._request_ids), params=message_params
+        )
+        async for chunk in _buffered(
+            client.send_message_streaming(streaming_request)
+        ):
+            if isinstance(chunk.root, SendStreamingMessageSuccessResponse) and isinstance(
+                chunk.root.result, TaskStatusUpdateEvent
+            ):
+                msg = chunk.root.result.status.message
+                if msg and msg.parts and hasattr(msg.parts[0].root, 'text'):
+                    # Only yield if the part is a TextPart
+                    part = msg.parts[0].root
+                    if isinstance(part, TextPart):
+                        yield part.text
+
+    async def _stream_decision(
+        self,
+        question: str,
+        agents_prompt: str,
+        called_agents: list[dict],
+        selected_agents: list[dict],
+    ) -> AsyncIterator[str]:
+        """Stream the decide response and collect the agents it selects.
+
+        The LLM stream is cancelled as soon as the selected agents block is
+        closed, instead of waiting for the rest of the LLM output, and also
+        when the caller stops reading early.
+
+        Args:
+            question (str): The question to answer.
+            agents_prompt (str): The prompt describing available agents.
+            called_agents (list[dict]): Previously called agents and their
+                answers.
+            selected_agents (list[dict]): Filled with the agents the LLM
+                selects.
+
+        Yields:
+            str: The LLM response chunks.
+        """
+        scanner = _FencedJsonScanner()
+        llm_chunks = _LLMStream(
+            await self.decide(question, agents_prompt, called_agents)
+        )
+        try:
+            async for llm_chunk in llm_chunks:
+                chunk = llm_chunk.text
+                if self.token_stream_callback:
+                    self.token_stream_callback(chunk)
+                yield chunk
+                if agents := scanner.feed(chunk):
+                    selected_agents.extend(agents)
+                    return
+        finally:
+            llm_chunks.close()
+
+    async def _call_agents(
+        self,
+        agents: list[dict],
+        agents_registry: dict[str, AgentCard],
+        agent_answers: list[dict],
+    ) -> AsyncIterator[str]:
+        """Call the selected agents concurrently and stream their answers.
+
+        Each answer is buffered in its own queue and replayed in order, so the
+        output stays grouped per agent while the wall time is that of the
+        slowest agent rather than the sum of all of them.
+
+        Args:
+            agents (list[dict]): The agents selected by the LLM.
+            agents_registry (dict[str, AgentCard]): The known agents by name.
+            agent_answers (list[dict]): Extended with each agent's answer.
+
+        Yields:
+            str: The agent responses, each wrapped in an `<Agent>` tag.
+        """
+        # Resolve every card first, so an unknown agent name fails before any
+        # agent call has been started.
+        agent_cards = [agents_registry[agent['name']] for agent in agents]
+        queues = [asyncio.Queue() for _ in agents]
+        pumps = [
+            asyncio.create_task(
+                _pump(
+                    self.send_message_to_an_agent(agent_card, agent['prompt']),
+                    queue,
                 )
             )
-            streaming_request = SendStreamingMessageRequest(id=str(uuid4()), params=message_params)
-            async for chunk in client.send_message_streaming(streaming_request):
-                if isinstance(chunk.root, SendStreamingMessageSuccessResponse) and isinstance(
-                    chunk.root.result, TaskStatusUpdateEvent
-                ):
-                    msg = chunk.root.result.status.message
-                    if msg and msg.parts and hasattr(msg.parts[0].root, 'text'):
-                        # Only yield if the part is a TextPart
-                        part = msg.parts[0].root
-                        if isinstance(part, TextPart):
-                            yield part.text
+            for agent, agent_card, queue in zip(
+                agents, agent_cards, queues, strict=True
+            )
+        ]
+        try:
+            for agent, queue in zip(agents, queues, strict=True):
+                agent_parts: list[str] = []
+                yield f'<Agent name="{agent["name"]}">\n'
+                async for chunk in _drain(queue):
+                    agent_parts.append(chunk)
+                    if self.token_stream_callback:
+                        self.token_stream_callback(chunk)
+                    yield chunk
+                yield '</Agent>\n'
+                agent_response = ''.join(agent_parts)
+                answer = _find_between(
+                    agent_response, _ANSWER_OPEN, _ANSWER_CLOSE
+                )
+                answer = (
+                    answer.strip() if answer is not None else agent_response
+                )
+                agent_answers.append(
+                    {
+                        'name': agent['name'],
+                        'prompt': agent['prompt'],
+                        'answer': answer,
+                    }
+                )
+        finally:
+            for pump in pumps:
+                pump.cancel()
+            await asyncio.gather(*pumps, return_exceptions=True)
 
     async def stream(self, question: str):
         """Stream the process of answering a question, possibly involving multiple agents.
@@ -168,38 +579,34 @@ class Agent:
             str: Streaming output, including agent responses and intermediate steps.
         """
         agent_answers: list[dict] = []
+        agent_prompt: str | None = None
         for _ in range(3):
-            agents_registry, agent_prompt = await self.get_agents()
-            response = ''
-            for chunk in await self.decide(question, agent_prompt, agent_answers):
-                response += chunk
-                if self.token_stream_callback:
-                    self.token_stream_callback(chunk)
-                yield chunk
-
-            agents = self.extract_agents(response)
-            if agents:
-                for agent in agents:
-                    agent_response = ''
-                    agent_card = agents_registry[agent['name']]
-                    yield f'<Agent name="{agent["name"]}">\n'
-                    async for chunk in self.send_message_to_an_agent(agent_card, agent['prompt']):
-                        agent_response += chunk
-                        if self.token_stream_callback:
-                            self.token_stream_callback(chunk)
-                        yield chunk
-                    yield '</Agent>\n'
-                    match = re.search(r'<Answer>(.*?)</Answer>', agent_response, re.DOTALL)
-                    answer = match.group(1).strip() if match else agent_response
-                    agent_answers.append(
-                        {
-                            'name': agent['name'],
-                            'prompt': agent['prompt'],
-                            'answer': answer,
-                        }
+            # Refresh the agent cards while the LLM streams. Only the first
+            # round waits for them; later rounds prompt with the previous
+            # cards and await the refreshed registry just before dispatch.
+            cards_task = asyncio.create_task(self.get_agents())
+            try:
+                if agent_prompt is None:
+                    agents_registry, agent_prompt = await cards_task
+                agents: list[dict] = []
+                async with aclosing(
+                    self._stream_decision(
+                        question, agent_prompt, agent_answers, agents
                     )
-            else:
-                return
+                ) as chunks:
+                    async for chunk in chunks:
+                        yield chunk
+                if not agents:
+                    return
+                agents_registry, agent_prompt = await cards_task
+            finally:
+                cards_task.cancel()
+                await asyncio.gather(cards_task, return_exceptions=True)
+            async with aclosing(
+                self._call_agents(agents, agents_registry, agent_answers)
+            ) as chunks:
+                async for chunk in chunks:
+                    yield chunk
 
 
 if __name__ == '__main__':
@@ -215,12 +622,15 @@ if __name__ == '__main__':
             agent_urls=['http://localhost:9999/'],
         )
 
-        async for chunk in agent.stream('What is A2A protocol?'):
-            if chunk.startswith('<Agent name="'):
-                print(colorama.Fore.CYAN + chunk, end='', flush=True)
-            elif chunk.startswith('</Agent>'):
-                print(colorama.Fore.RESET + chunk, end='', flush=True)
-            else:
-                print(chunk, end='', flush=True)
+        try:
+            async for chunk in agent.stream('What is A2A protocol?'):
+                if chunk.startswith('<Agent name="'):
+                    print(colorama.Fore.CYAN + chunk, end='', flush=True)
+                elif chunk.startswith('</Agent>'):
+                    print(colorama.Fore.RESET + chunk, end='', flush=True)
+                else:
+                    print(chunk, end='', flush=True)
+        finally:
+            await agent.aclose()
 
     asyncio.run(main())